@@ -1,6 +1,15 @@
 import pygame
 import time
 
+import numpy as np
+
+# Numba is optional: when present, the jump-chain search runs as compiled
+# machine code; otherwise the pure-Python search is used.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Initialize Pygame first to use its functions
 pygame.init()
 
@@ -15,21 +24,18 @@ ROWS, COLS = 8, 8
 SQUARE_SIZE = WIDTH // COLS
 
 # --- RGB Colors ---
-RED = (255, 0, 0)
-WHITE = (255, 255, 255)
+RED_RGB = (255, 0, 0)
+WHITE_RGB = (255, 255, 255)
 BLACK = (0, 0, 0)
 BLUE = (0, 0, 255)
 GREY = (128, 128, 128)
 
-# --- Images ---
-# The crown image is used to denote a "King" piece.
-# Ensure you have an 'assets' folder with 'crown.png' in it.
-try:
-    CROWN = pygame.transform.scale(pygame.image.load('assets/crown.png'), (44, 25))
-except pygame.error as e:
-    print("Error loading crown image: 'assets/crown.png'. Please ensure the file exists.")
-    print("A default shape will be used for kings instead.")
-    CROWN = None
+# --- Side identities ---
+# The two sides are small ints, so the hot piece.color/turn comparisons are
+# single int compares; the RGB tuples above are only touched at draw time.
+RED = 0
+WHITE = 1
+COLOR_RGB = {RED: RED_RGB, WHITE: WHITE_RGB}
 
 
 # -----------------------------------------------------------------------------
@@ -41,6 +47,8 @@ class Piece:
     """
     Represents a single checker piece on the board.
     """
+    __slots__ = ('row', 'col', 'color', 'king', 'x', 'y')
+
     PADDING = 15
     OUTLINE = 2
 
@@ -54,25 +62,17 @@ class Piece:
         self.calc_pos()
 
     def calc_pos(self):
-        """Calculates the x, y pixel coordinates based on row and col."""
-        self.x = SQUARE_SIZE * self.col + SQUARE_SIZE // 2
-        self.y = SQUARE_SIZE * self.row + SQUARE_SIZE // 2
+        """Looks up the x, y pixel coordinates for the piece's row and col."""
+        self.x, self.y = CENTERS[self.row][self.col]
 
     def make_king(self):
         """Makes the current piece a king."""
         self.king = True
 
     def draw(self, win):
-        """Draws the piece on the window."""
-        radius = SQUARE_SIZE // 2 - self.PADDING
-        pygame.draw.circle(win, GREY, (self.x, self.y), radius + self.OUTLINE)
-        pygame.draw.circle(win, self.color, (self.x, self.y), radius)
-        if self.king:
-            if CROWN:
-                win.blit(CROWN, (self.x - CROWN.get_width() // 2, self.y - CROWN.get_height() // 2))
-            else: # Fallback if image not found
-                pygame.draw.circle(win, BLUE, (self.x, self.y), radius // 2)
-
+        """Draws the piece by blitting its pre-rendered surface."""
+        win.blit(PIECE_SURFACES[(self.color, self.king)],
+                 (self.col * SQUARE_SIZE, self.row * SQUARE_SIZE))
 
     def move(self, row, col):
         """Updates the piece's row and column and recalculates pixel position."""
@@ -84,6 +84,145 @@ class Piece:
         """String representation of the piece, useful for debugging."""
         return str(self.color)
 
+
+# Geometry derived from the constants above, hoisted so the draw paths never
+# recompute it: piece radii and the pixel center of every square.
+RADIUS = SQUARE_SIZE // 2 - Piece.PADDING
+RADIUS_OUTLINE = RADIUS + Piece.OUTLINE
+CENTERS = [[(col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2)
+            for col in range(COLS)] for row in range(ROWS)]
+
+# -----------------------------------------------------------------------------
+# --- BITBOARD LAYOUT ---
+# The board state lives in four integers, one bit per square. The bit index
+# for the square at (row, col) is row * 8 + col; only the 32 dark squares
+# ((row + col) odd) are ever populated, so every diagonal step is a uniform
+# shift of 7 or 9 regardless of which square it starts from.
+# -----------------------------------------------------------------------------
+
+DARK_SQUARES = 0
+for _row in range(ROWS):
+    for _col in range((_row + 1) % 2, COLS, 2):
+        DARK_SQUARES |= 1 << (_row * COLS + _col)
+
+# Dark squares that have a neighbour towards the given board edge; shifting
+# through these masks prevents moves from wrapping around the sides.
+NOT_LEFT_EDGE = DARK_SQUARES & ~sum(1 << (_row * COLS) for _row in range(ROWS))
+NOT_RIGHT_EDGE = DARK_SQUARES & ~sum(1 << (_row * COLS + COLS - 1) for _row in range(ROWS))
+NOT_TOP_EDGE = DARK_SQUARES & ~((1 << COLS) - 1)
+NOT_BOTTOM_EDGE = DARK_SQUARES & ((1 << ((ROWS - 1) * COLS)) - 1)
+
+# Diagonal step sizes. "North" is towards row 0, the direction RED moves;
+# negative values are right shifts.
+SHIFT_NW = -9
+SHIFT_NE = -7
+SHIFT_SW = 7
+SHIFT_SE = 9
+
+# Per-direction masks of the dark squares that actually have a neighbour in
+# that direction. Bounding the rows as well as the columns keeps every
+# shifted bitboard inside 64 bits, which the compiled kernel relies on.
+EDGE_MASKS = {
+    SHIFT_NW: NOT_LEFT_EDGE & NOT_TOP_EDGE,
+    SHIFT_NE: NOT_RIGHT_EDGE & NOT_TOP_EDGE,
+    SHIFT_SW: NOT_LEFT_EDGE & NOT_BOTTOM_EDGE,
+    SHIFT_SE: NOT_RIGHT_EDGE & NOT_BOTTOM_EDGE,
+}
+
+NORTH_DIRECTIONS = (SHIFT_NW, SHIFT_NE)
+SOUTH_DIRECTIONS = (SHIFT_SW, SHIFT_SE)
+
+MAN_DIRECTIONS = {
+    RED: NORTH_DIRECTIONS,
+    WHITE: SOUTH_DIRECTIONS,
+}
+KING_DIRECTIONS = NORTH_DIRECTIONS + SOUTH_DIRECTIONS
+
+# Starting positions: WHITE fills rows 0-2, RED fills rows 5-7.
+WHITE_START = DARK_SQUARES & ((1 << (3 * COLS)) - 1)
+RED_START = DARK_SQUARES & ~((1 << (5 * COLS)) - 1)
+
+# Promotion rows as bit masks: ANDing a man's destination bit with its
+# color's mask is the whole promotion test.
+PROMOTION_MASKS = {
+    RED: DARK_SQUARES & ((1 << COLS) - 1),                    # row 0
+    WHITE: DARK_SQUARES & ~((1 << ((ROWS - 1) * COLS)) - 1),  # row 7
+}
+
+
+def shift(bitboard, direction):
+    """Shifts a bitboard one diagonal step, masking off edge wrap-around."""
+    bitboard &= EDGE_MASKS[direction]
+    if direction < 0:
+        return bitboard >> -direction
+    return bitboard << direction
+
+# Per-square jump tables, built once at import time. PAIR_JUMPS[pair][bit] is
+# a tuple of (over_bit, landing_bit) pairs for every jump geometrically
+# possible from that square in the given pair of directions; squares with no
+# landing square in either direction are simply absent.
+PAIR_JUMPS = {}
+for _pair in (NORTH_DIRECTIONS, SOUTH_DIRECTIONS):
+    PAIR_JUMPS[_pair] = {}
+    for _row in range(ROWS):
+        for _col in range((_row + 1) % 2, COLS, 2):
+            _bit = 1 << (_row * COLS + _col)
+            _entries = []
+            for _direction in _pair:
+                _over = shift(_bit, _direction)
+                _land = shift(_over, _direction)
+                if _land:
+                    _entries.append((_over, _land))
+            if _entries:
+                PAIR_JUMPS[_pair][_bit] = tuple(_entries)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _jump_chains(src, enemy, empty, mask_a, dir_a, mask_b, dir_b):
+        """Compiled jump-chain search over one pair of directions.
+
+        Returns (dests, captures, count): parallel arrays holding, for every
+        chain found from src, the landing-square bit and the bitboard of
+        captured pieces. All values fit in int64 since no dark square ever
+        shifts past bit 62.
+        """
+        dests = np.empty(256, dtype=np.int64)
+        captures = np.empty(256, dtype=np.int64)
+        stack_bit = np.empty(256, dtype=np.int64)
+        stack_cap = np.empty(256, dtype=np.int64)
+        count = 0
+        stack_bit[0] = src
+        stack_cap[0] = 0
+        top = 1
+        while top > 0:
+            top -= 1
+            bit = stack_bit[top]
+            captured = stack_cap[top]
+            for k in range(2):
+                if k == 0:
+                    mask, direction = mask_a, dir_a
+                else:
+                    mask, direction = mask_b, dir_b
+                if direction < 0:
+                    over = (bit & mask) >> -direction
+                    land = (over & mask) >> -direction
+                else:
+                    over = (bit & mask) << direction
+                    land = (over & mask) << direction
+                if over & enemy and not over & captured and land & empty:
+                    chained = captured | over
+                    if count < 256 and top < 256:
+                        dests[count] = land
+                        captures[count] = chained
+                        count += 1
+                        stack_bit[top] = land
+                        stack_cap[top] = chained
+                        top += 1
+        return dests, captures, count
+else:
+    _jump_chains = None
+
 # -----------------------------------------------------------------------------
 # --- BOARD CLASS ---
 # This section replaces the 'board.py' file
@@ -91,165 +230,305 @@ class Piece:
 
 class Board:
     """
-    Manages the board's internal data structure, pieces, and game logic for moves.
+    Manages the board state as four bitboards (red men, red kings, white men,
+    white kings) and implements the game logic for moves as shift-and-mask
+    operations. Piece objects are only materialized for rendering and for the
+    click-driven interface in Game.
     """
     def __init__(self):
-        self.board = []
-        self.red_left = self.white_left = 12
-        self.red_kings = self.white_kings = 0
+        self.red_men = 0
+        self.red_kings = 0
+        self.white_men = 0
+        self.white_kings = 0
+        self._pieces = None
+        self._moves_cache = {}
+        self._winner_cache = {}
+        self._move_buf = []
+        self.dirty_squares = set()
         self.create_board()
 
+    def create_board(self):
+        """Initializes the bitboards with pieces in starting positions."""
+        self.red_men = RED_START
+        self.red_kings = 0
+        self.white_men = WHITE_START
+        self.white_kings = 0
+        self._pieces = None
+        self._moves_cache = {}
+        self._winner_cache = {}
+
+    def clone(self):
+        """Returns an independent copy of the position.
+
+        The whole state is the four bitboards, so a copy is four int
+        assignments - cheap enough to clone per node in tree search instead
+        of deep-copying Piece objects.
+        """
+        board = Board.__new__(Board)
+        board.red_men = self.red_men
+        board.red_kings = self.red_kings
+        board.white_men = self.white_men
+        board.white_kings = self.white_kings
+        board._pieces = None
+        board._moves_cache = {}
+        board._winner_cache = {}
+        board._move_buf = []
+        board.dirty_squares = set()
+        return board
+
+    @property
+    def red_left(self):
+        """Number of red pieces still on the board."""
+        return (self.red_men | self.red_kings).bit_count()
+
+    @property
+    def white_left(self):
+        """Number of white pieces still on the board."""
+        return (self.white_men | self.white_kings).bit_count()
+
+    def as_array(self):
+        """Returns the position as an 8x8 NumPy int8 array for AI evaluation.
+
+        Squares hold 1 (red man), 2 (red king), -1 (white man), -2 (white
+        king) or 0 (empty). The unpacking is vectorized, so batch consumers
+        (state encoders, evaluation functions) never touch Piece objects.
+        """
+        grid = np.zeros(ROWS * COLS, dtype=np.int8)
+        for bitboard, value in (
+            (self.red_men, 1),
+            (self.red_kings, 2),
+            (self.white_men, -1),
+            (self.white_kings, -2),
+        ):
+            bits = np.frombuffer(bitboard.to_bytes(8, 'little'), dtype=np.uint8)
+            grid += value * np.unpackbits(bits, bitorder='little').astype(np.int8)
+        return grid.reshape(ROWS, COLS)
+
+    def pieces(self):
+        """Returns the Piece objects for the current position, keyed by bit.
+
+        The pieces are regenerated from the bitboards on demand and cached
+        until the position changes.
+        """
+        if self._pieces is None:
+            self._pieces = {}
+            for bitboard, color, king in (
+                (self.red_men, RED, False),
+                (self.red_kings, RED, True),
+                (self.white_men, WHITE, False),
+                (self.white_kings, WHITE, True),
+            ):
+                while bitboard:
+                    bit = bitboard & -bitboard
+                    row, col = divmod(bit.bit_length() - 1, COLS)
+                    piece = Piece(row, col, color)
+                    if king:
+                        piece.make_king()
+                    self._pieces[bit] = piece
+                    bitboard ^= bit
+        return self._pieces
+
     def draw_squares(self, win):
-        """Draws the checkerboard pattern."""
-        win.fill(BLACK)
-        for row in range(ROWS):
-            for col in range(row % 2, COLS, 2):
-                pygame.draw.rect(win, RED, (row * SQUARE_SIZE, col * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+        """Draws the checkerboard pattern from the pre-rendered background."""
+        win.blit(BOARD_BG, (0, 0))
 
     def move(self, piece, row, col):
         """Moves a piece and promotes it to a king if necessary."""
-        self.board[piece.row][piece.col], self.board[row][col] = self.board[row][col], self.board[piece.row][piece.col]
-        piece.move(row, col)
+        src = 1 << (piece.row * COLS + piece.col)
+        dst = 1 << (row * COLS + col)
+        self.dirty_squares.add((piece.row, piece.col))
+        self.dirty_squares.add((row, col))
+
+        if piece.color == RED:
+            men, kings = self.red_men, self.red_kings
+        else:
+            men, kings = self.white_men, self.white_kings
 
-        if row == ROWS - 1 or row == 0:
-            if not piece.king:
+        if piece.king:
+            kings = (kings & ~src) | dst
+        else:
+            men = (men & ~src) | dst
+            # Promotion is a mask test on the destination bit rather than a
+            # chain of row comparisons.
+            promoted = men & PROMOTION_MASKS[piece.color]
+            men &= ~promoted
+            kings |= promoted
+            if promoted:
                 piece.make_king()
-                if piece.color == WHITE:
-                    self.white_kings += 1
-                else:
-                    self.red_kings += 1
-    
-    def get_piece(self, row, col):
-        """Returns the piece object at a given row and col."""
-        return self.board[row][col]
 
-    def create_board(self):
-        """Initializes the board with pieces in starting positions."""
-        for row in range(ROWS):
-            self.board.append([])
-            for col in range(COLS):
-                if col % 2 == ((row + 1) % 2):
-                    if row < 3:
-                        self.board[row].append(Piece(row, col, WHITE))
-                    elif row > 4:
-                        self.board[row].append(Piece(row, col, RED))
-                    else:
-                        self.board[row].append(0)
-                else:
-                    self.board[row].append(0)
+        if piece.color == RED:
+            self.red_men, self.red_kings = men, kings
+        else:
+            self.white_men, self.white_kings = men, kings
+
+        piece.move(row, col)
+
+        self._pieces = None
+        self._moves_cache.clear()
+        self._winner_cache.clear()
+
+    def get_piece(self, row, col):
+        """Returns the piece object at a given row and col, or 0 if empty."""
+        return self.pieces().get(1 << (row * COLS + col), 0)
 
     def draw(self, win):
         """Draws the entire board, including squares and pieces."""
         self.draw_squares(win)
-        for row in range(ROWS):
-            for col in range(COLS):
-                piece = self.board[row][col]
-                if piece != 0:
-                    piece.draw(win)
+        for piece in self.pieces().values():
+            piece.draw(win)
 
     def remove(self, pieces):
         """Removes captured pieces from the board."""
         for piece in pieces:
-            self.board[piece.row][piece.col] = 0
-            if piece != 0:
-                if piece.color == RED:
-                    self.red_left -= 1
-                else:
-                    self.white_left -= 1
-    
-    def winner(self):
-        """Determines the winner."""
+            mask = ~(1 << (piece.row * COLS + piece.col))
+            self.dirty_squares.add((piece.row, piece.col))
+            self.red_men &= mask
+            self.red_kings &= mask
+            self.white_men &= mask
+            self.white_kings &= mask
+        self._pieces = None
+        self._moves_cache.clear()
+        self._winner_cache.clear()
+
+    def winner(self, turn=None):
+        """Determines the winner.
+
+        Besides the piece-count conditions, the side to move (when given)
+        loses if it has no legal move. The result is cached until the
+        position changes, so the per-loop winner check in main is O(1).
+        """
+        if turn in self._winner_cache:
+            return self._winner_cache[turn]
+
         if self.red_left <= 0:
-            return WHITE
+            result = WHITE
         elif self.white_left <= 0:
-            return RED
-        
-        return None
+            result = RED
+        elif turn is not None and not self.has_any_move(turn):
+            result = WHITE if turn == RED else RED
+        else:
+            result = None
+
+        self._winner_cache[turn] = result
+        return result
+
+    def has_any_move(self, color):
+        """Checks whether a color has at least one legal move.
+
+        The common case - some piece has a simple move - is answered with a
+        handful of whole-board shifts; only jump-only positions fall back to
+        the per-piece search.
+        """
+        occupied = self.red_men | self.red_kings | self.white_men | self.white_kings
+        empty = DARK_SQUARES & ~occupied
+        if color == RED:
+            men, kings = self.red_men, self.red_kings
+        else:
+            men, kings = self.white_men, self.white_kings
+
+        for direction in MAN_DIRECTIONS[color]:
+            if shift(men | kings, direction) & empty:
+                return True
+        for direction in KING_DIRECTIONS:
+            if shift(kings, direction) & empty:
+                return True
+
+        for piece in self.pieces().values():
+            if piece.color == color and self.get_valid_moves(piece):
+                return True
+        return False
 
     def get_valid_moves(self, piece):
-        """Calculates all valid moves for a given piece."""
-        moves = {}
-        left = piece.col - 1
-        right = piece.col + 1
-        row = piece.row
-
-        if piece.color == RED or piece.king:
-            moves.update(self._traverse_left(row - 1, max(row - 3, -1), -1, piece.color, left))
-            moves.update(self._traverse_right(row - 1, max(row - 3, -1), -1, piece.color, right))
-        
-        if piece.color == WHITE or piece.king:
-            moves.update(self._traverse_left(row + 1, min(row + 3, ROWS), 1, piece.color, left))
-            moves.update(self._traverse_right(row + 1, min(row + 3, ROWS), 1, piece.color, right))
-
-        return moves
+        """Calculates all valid moves for a given piece.
+
+        Returns a dict mapping each destination (row, col) to the Piece
+        objects captured along the way. Results are cached per square until
+        the position changes, so repeated queries within a turn (clicks, AI
+        drivers) cost a single dict lookup.
+        """
+        src = 1 << (piece.row * COLS + piece.col)
+        cached = self._moves_cache.get(src)
+        if cached is not None:
+            return cached
+
+        # Accumulate (dest_bit, skipped) pairs in a reused flat buffer and
+        # build the result dict once at the end, instead of hashing each
+        # destination as it is found.
+        out = self._move_buf
+        out.clear()
+        occupied = self.red_men | self.red_kings | self.white_men | self.white_kings
+        empty = DARK_SQUARES & ~occupied
+        if piece.color == RED:
+            enemy = self.white_men | self.white_kings
+        else:
+            enemy = self.red_men | self.red_kings
+        directions = KING_DIRECTIONS if piece.king else MAN_DIRECTIONS[piece.color]
+
+        for direction in directions:
+            dest = shift(src, direction) & empty
+            if dest:
+                out.append((dest, ()))
+
+        # A jump chain keeps the row direction of its first jump: men only
+        # jump forwards, and a king chain going north stays north (it may
+        # still alternate between NW and NE).
+        if piece.king:
+            jump_pairs = (NORTH_DIRECTIONS, SOUTH_DIRECTIONS)
+        else:
+            jump_pairs = (MAN_DIRECTIONS[piece.color],)
+        for pair in jump_pairs:
+            self._find_jumps(src, pair, enemy, empty, out)
 
-    def _traverse_left(self, start, stop, step, color, left, skipped=[]):
-        """Helper for recursively finding valid moves to the left."""
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if left < 0:
-                break
-            
-            current = self.board[r][left]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r, left)] = last + skipped
-                else:
-                    moves[(r, left)] = last
-                
-                if last:
-                    if step == -1:
-                        row = max(r-3, -1)
-                    else:
-                        row = min(r+3, ROWS)
-                    moves.update(self._traverse_left(r+step, row, step, color, left-1, skipped=last))
-                    moves.update(self._traverse_right(r+step, row, step, color, left+1, skipped=last))
-                break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-
-            left -= 1
-        
+        moves = {divmod(bit.bit_length() - 1, COLS): skipped for bit, skipped in out}
+        self._moves_cache[src] = moves
         return moves
 
-    def _traverse_right(self, start, stop, step, color, right, skipped=[]):
-        """Helper for recursively finding valid moves to the right."""
-        moves = {}
-        last = []
-        for r in range(start, stop, step):
-            if right >= COLS:
-                break
-            
-            current = self.board[r][right]
-            if current == 0:
-                if skipped and not last:
-                    break
-                elif skipped:
-                    moves[(r,right)] = last + skipped
-                else:
-                    moves[(r, right)] = last
-                
-                if last:
-                    if step == -1:
-                        row = max(r-3, -1)
-                    else:
-                        row = min(r+3, ROWS)
-                    moves.update(self._traverse_left(r+step, row, step, color, right-1,skipped=last))
-                    moves.update(self._traverse_right(r+step, row, step, color, right+1,skipped=last))
-                break
-            elif current.color == color:
-                break
-            else:
-                last = [current]
-
-            right += 1
-        
-        return moves
+    def get_all_valid_moves(self, color):
+        """Calculates the moves for every piece of a color in one pass.
+
+        Returns a dict mapping each piece's (row, col) to its moves dict, for
+        AI-style consumers that need the whole ply rather than calling
+        get_valid_moves per piece inside a loop.
+        """
+        all_moves = {}
+        for piece in self.pieces().values():
+            if piece.color == color:
+                all_moves[(piece.row, piece.col)] = self.get_valid_moves(piece)
+        return all_moves
+
+    def _find_jumps(self, src, pair, enemy, empty, out):
+        """Collects jump chains starting from the given square.
+
+        Iterative depth-first search over an explicit stack, driven by the
+        precomputed PAIR_JUMPS tables. The captured pieces are carried as
+        tuples so chain prefixes are shared rather than copied. When Numba is
+        available, the search runs in the compiled _jump_chains kernel
+        instead and only the Piece lookup stays in Python.
+        """
+        pieces = self.pieces()
+        if _jump_chains is not None:
+            dir_a, dir_b = pair
+            dests, captures, count = _jump_chains(
+                src, enemy, empty, EDGE_MASKS[dir_a], dir_a, EDGE_MASKS[dir_b], dir_b)
+            for i in range(count):
+                captured = int(captures[i])
+                skipped = []
+                while captured:
+                    bit = captured & -captured
+                    skipped.append(pieces[bit])
+                    captured ^= bit
+                out.append((int(dests[i]), tuple(skipped)))
+            return
+
+        jumps = PAIR_JUMPS[pair]
+        stack = [(src, 0, ())]
+        while stack:
+            bit, captured, skipped = stack.pop()
+            for over, land in jumps.get(bit, ()):
+                if over & enemy and not over & captured and land & empty:
+                    jumped = skipped + (pieces[over],)
+                    out.append((land, jumped))
+                    stack.append((land, captured | over, jumped))
 
 # -----------------------------------------------------------------------------
 # --- GAME CLASS ---
@@ -265,10 +544,31 @@ class Game:
         self.win = win
 
     def update(self):
-        """Updates the display with the current board state."""
+        """Redraws the board and pushes only the changed regions to screen.
+
+        The scene is redrawn into the window every call (all cheap blits),
+        but pygame.display.update is given just the squares that changed
+        since the previous frame - moved/removed pieces and valid-move
+        indicators that appeared or disappeared - and is skipped entirely
+        when nothing changed.
+        """
         self.board.draw(self.win)
         self.draw_valid_moves(self.valid_moves)
-        pygame.display.update()
+
+        changed = self.board.dirty_squares
+        shown = set(self.valid_moves)
+        changed |= shown ^ self._shown_moves
+        self._shown_moves = shown
+        self.board.dirty_squares = set()
+
+        if self._full_redraw:
+            self._full_redraw = False
+            pygame.display.update()
+        elif changed:
+            pygame.display.update([
+                pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+                for row, col in changed
+            ])
 
     def _init(self):
         """Initializes a new game."""
@@ -276,10 +576,12 @@ class Game:
         self.board = Board()
         self.turn = RED
         self.valid_moves = {}
+        self._shown_moves = set()
+        self._full_redraw = True
 
     def winner(self):
         """Returns the winner of the game, if there is one."""
-        return self.board.winner()
+        return self.board.winner(self.turn)
 
     def reset(self):
         """Resets the game to the initial state."""
@@ -314,10 +616,12 @@ class Game:
         return False
 
     def draw_valid_moves(self, moves):
-        """Draws blue circles on squares that are valid moves."""
-        for move in moves:
-            row, col = move
-            pygame.draw.circle(self.win, BLUE, (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), 15)
+        """Draws blue dots on squares that are valid moves in one batch."""
+        if moves:
+            self.win.blits([
+                (BLUE_DOT, (CENTERS[row][col][0] - DOT_RADIUS, CENTERS[row][col][1] - DOT_RADIUS))
+                for row, col in moves
+            ])
 
     def change_turn(self):
         """Changes the current player's turn."""
@@ -332,11 +636,92 @@ class Game:
 # This section replaces the 'main.py' file
 # -----------------------------------------------------------------------------
 
-FPS = 60
+# How long event.wait blocks before giving the loop a chance to run, in
+# milliseconds; between clicks the process sleeps instead of redrawing.
+EVENT_TIMEOUT = 100
 
 WIN = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption('Checkers')
 
+# --- Images ---
+# The crown image is used to denote a "King" piece.
+# Ensure you have an 'assets' folder with 'crown.png' in it.
+# Loaded after set_mode so convert_alpha() can match the display format;
+# without it every crown blit does a per-pixel format conversion.
+try:
+    CROWN = pygame.transform.scale(pygame.image.load('assets/crown.png'), (44, 25)).convert_alpha()
+except pygame.error as e:
+    print("Error loading crown image: 'assets/crown.png'. Please ensure the file exists.")
+    print("A default shape will be used for kings instead.")
+    CROWN = None
+
+# The checkerboard never changes, so render it once into a display-format
+# surface and blit that every frame instead of issuing 32 rect fills.
+BOARD_BG = pygame.Surface((WIDTH, HEIGHT)).convert()
+BOARD_BG.fill(BLACK)
+for _row in range(ROWS):
+    for _col in range(_row % 2, COLS, 2):
+        pygame.draw.rect(BOARD_BG, RED_RGB, (_col * SQUARE_SIZE, _row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+
+
+def _build_piece_surface(color, king):
+    """Rasterizes one piece appearance into an alpha surface."""
+    surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
+    center = (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
+    pygame.draw.circle(surface, GREY, center, RADIUS_OUTLINE)
+    pygame.draw.circle(surface, COLOR_RGB[color], center, RADIUS)
+    if king:
+        if CROWN:
+            surface.blit(CROWN, (center[0] - CROWN.get_width() // 2,
+                                 center[1] - CROWN.get_height() // 2))
+        else: # Fallback if image not found
+            pygame.draw.circle(surface, BLUE, center, RADIUS // 2)
+    return surface
+
+# The four piece appearances are rasterized once at startup; Piece.draw is
+# then a single blit instead of two circle draws (plus a crown) per piece
+# per frame.
+PIECE_SURFACES = {
+    (color, king): _build_piece_surface(color, king)
+    for color in (RED, WHITE)
+    for king in (False, True)
+}
+
+# The valid-move indicator dot, rasterized once; indicators are then drawn
+# with a single batched blits() call instead of one circle draw per square.
+DOT_RADIUS = 15
+BLUE_DOT = pygame.Surface((2 * DOT_RADIUS, 2 * DOT_RADIUS), pygame.SRCALPHA)
+pygame.draw.circle(BLUE_DOT, BLUE, (DOT_RADIUS, DOT_RADIUS), DOT_RADIUS)
+BLUE_DOT = BLUE_DOT.convert_alpha()
+
+# Game-over rendering, prepared once at startup: the font load is slow (tens
+# of milliseconds) and there are only two possible victory banners.
+GAME_OVER_FONT = pygame.font.SysFont("comicsans", 80)
+WIN_TEXTS = {
+    RED: GAME_OVER_FONT.render("Red Wins!", True, BLUE),
+    WHITE: GAME_OVER_FONT.render("White Wins!", True, BLUE),
+}
+
+def perft(board, color, depth):
+    """Counts the move sequences of the given depth from a position.
+
+    A benchmarking hook for search-style workloads: each move is applied to
+    a clone of the board, exactly as an AI driver would expand the tree.
+    """
+    if depth == 0:
+        return 1
+
+    total = 0
+    for (row, col), moves in board.get_all_valid_moves(color).items():
+        for dest, skipped in moves.items():
+            child = board.clone()
+            child.move(child.get_piece(row, col), *dest)
+            if skipped:
+                child.remove(skipped)
+            total += perft(child, WHITE if color == RED else RED, depth - 1)
+    return total
+
+
 def get_row_col_from_mouse(pos):
     """Converts mouse (x, y) coordinates to board (row, col) coordinates."""
     x, y = pos
@@ -347,40 +732,65 @@ def get_row_col_from_mouse(pos):
 def main():
     """Main function to run the game."""
     run = True
-    clock = pygame.time.Clock()
     game = Game(WIN)
 
+    # The game is turn-based with nothing to animate, so instead of polling
+    # at a fixed frame rate the loop blocks until an event arrives. Only the
+    # events the game reacts to are allowed into the queue, so mouse motion
+    # never wakes the loop.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
+    game.update()
+
     while run:
-        clock.tick(FPS)
+        event = pygame.event.wait(EVENT_TIMEOUT)
 
-        if game.winner() is not None:
-            winner_color_val = game.winner()
-            winner_color_name = "Red" if winner_color_val == RED else "White"
-            
-            # Display winner message on screen
-            font = pygame.font.SysFont("comicsans", 80)
-            text = font.render(f"{winner_color_name} Wins!", True, BLUE)
-            WIN.blit(text, (WIDTH/2 - text.get_width()/2, HEIGHT/2 - text.get_height()/2))
-            pygame.display.update()
-            
-            print(f"Game Over: {winner_color_name} wins!")
-            time.sleep(5) # Pause for 5 seconds before closing
+        if event.type == pygame.QUIT:
             run = False
             continue
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            pos = pygame.mouse.get_pos()
+            row, col = get_row_col_from_mouse(pos)
+            game.select(row, col)
+            game.update()
+
+            # The winner can only change when a move happened, so the check
+            # lives in the click branch rather than running per wakeup.
+            if game.winner() is not None:
+                winner_color_val = game.winner()
+                winner_color_name = "Red" if winner_color_val == RED else "White"
+
+                # Display winner message on screen
+                text = WIN_TEXTS[winner_color_val]
+                WIN.blit(text, (WIDTH/2 - text.get_width()/2, HEIGHT/2 - text.get_height()/2))
+                pygame.display.update()
+
+                print(f"Game Over: {winner_color_name} wins!")
+                # Keep the banner up for 5 seconds, but stay responsive to
+                # QUIT instead of sleeping through it.
+                deadline = pygame.time.get_ticks() + 5000
+                while True:
+                    remaining = deadline - pygame.time.get_ticks()
+                    if remaining <= 0:
+                        break
+                    if pygame.event.wait(remaining).type == pygame.QUIT:
+                        break
                 run = False
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                pos = pygame.mouse.get_pos()
-                row, col = get_row_col_from_mouse(pos)
-                game.select(row, col)
-
-        game.update()
 
     pygame.quit()
 
 # This ensures the main function runs only when the script is executed directly
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    import sys
+
+    # 'python checkers.py --perft N' benchmarks move generation instead of
+    # starting the game.
+    if len(sys.argv) > 2 and sys.argv[1] == '--perft':
+        depth = int(sys.argv[2])
+        start = time.perf_counter()
+        nodes = perft(Board(), RED, depth)
+        elapsed = time.perf_counter() - start
+        print(f"perft({depth}) = {nodes} nodes in {elapsed:.3f}s ({nodes / elapsed:.0f} nodes/s)")
+    else:
+        main()
\ No newline at end of file